@@ -0,0 +1,119 @@
+import time
+import asyncio
+import threading
+from asyncio import AbstractEventLoop, Future
+from concurrent.futures import Executor
+from concurrent.futures import Future as ConcurrentFuture
+from typing import Any, Callable
+
+# Сколько пропусков подряд переводят сборщик в медленную полосу
+SLOW_LANE_MISSES = 3
+# Как часто опрашивается сборщик в медленной полосе (секунды)
+SLOW_LANE_INTERVAL = 5.0
+
+
+class DaemonExecutor(Executor):
+    """
+    Исполнитель, запускающий каждую задачу в отдельном фоновом
+    (daemon) потоке. В отличие от ThreadPoolExecutor, интерпретатор
+    не ждёт такие потоки при выходе, поэтому зависшее чтение датчика
+    не задерживает завершение программы.
+    """
+
+    def submit(self, fn, /, *args, **kwargs) -> ConcurrentFuture:
+        """Запуск функции в новом фоновом потоке."""
+        future: ConcurrentFuture = ConcurrentFuture()
+
+        def run() -> None:
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as exc:
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+
+        threading.Thread(target=run, daemon=True).start()
+        return future
+
+
+class Collector:
+    """
+    Сборщик данных с ограничением времени на один такт.
+
+    Если функция не уложилась в срок, на дисплей выводится результат
+    предыдущего такта, а незавершённое чтение продолжается в фоне.
+    Сборщик, который несколько тактов подряд не укладывается в срок,
+    переводится в медленную полосу: он опрашивается раз в
+    SLOW_LANE_INTERVAL секунд и кадр его больше не ждёт.
+    """
+
+    def __init__(self, func: Callable[[], Any], deadline: float) -> None:
+        """
+        :param func: Функция для сбора данных.
+        :param deadline: Допустимое время с начала такта (секунды).
+        """
+        self.func = func
+        self.deadline = deadline
+        self.result: Any = []
+        self.future: Future | None = None
+        self.misses = 0
+        self.slow = False
+        self.last_start = 0.0
+        self.duration = 0.0
+
+    def _timed_call(self) -> Any:
+        """Вызов функции с замером времени выполнения."""
+        start = time.monotonic()
+        try:
+            return self.func()
+        finally:
+            self.duration = time.monotonic() - start
+
+    def _harvest(self) -> None:
+        """Сохранение результата завершённого запуска."""
+        future, self.future = self.future, None
+        self.result = future.result()
+        if self.duration <= self.deadline:
+            self.misses = 0
+            self.slow = False
+
+    def submit(self, loop: AbstractEventLoop, pool: Executor) -> None:
+        """
+        Запуск сбора данных, если предыдущий запуск завершён.
+
+        :param loop: Цикл событий.
+        :param pool: Пул потоков для выполнения.
+        """
+        if self.future is not None:
+            if not self.future.done():
+                return
+            self._harvest()
+        now = time.monotonic()
+        if self.slow and now - self.last_start < SLOW_LANE_INTERVAL:
+            return
+        self.last_start = now
+        self.future = loop.run_in_executor(pool, self._timed_call)
+
+    async def collect(self, tick_start: float) -> Any:
+        """
+        Получение результата с учётом срока.
+
+        :param tick_start: Время начала такта (time.monotonic()).
+        """
+        future = self.future
+        if future is None:
+            return self.result
+
+        if not future.done() and not self.slow:
+            timeout = max(0.0, tick_start + self.deadline - time.monotonic())
+            await asyncio.wait({future}, timeout=timeout)
+
+        if future.done():
+            self._harvest()
+        elif not self.slow:
+            self.misses += 1
+            if self.misses >= SLOW_LANE_MISSES:
+                self.slow = True
+        return self.result
@@ -0,0 +1 @@
+"""Корневой conftest: модули проекта импортируются из корня репозитория."""
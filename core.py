@@ -1,15 +1,27 @@
-from typing import List
+from typing import Callable, List
 import os
 
 from table import format_table, create_separator
 
 from util import error_decorate
 
+HWMON_DIR = '/sys/class/hwmon'
+
 
 @error_decorate((FileNotFoundError, PermissionError, ValueError, OSError))
-def get_cpu_info() -> List[str]:
-    """Обработка информации о загрузке ядер."""
-    cpu_pairs: List[List[str]] = get_core_temperatures()
+def get_cpu_info(
+    hwmon_dir: str = HWMON_DIR,
+    on_read: Callable[[List[List[str]]], None] | None = None
+) -> List[str]:
+    """
+    Обработка информации о загрузке ядер.
+
+    :param hwmon_dir: Каталог hwmon.
+    :param on_read: Получатель прочитанных температур (например, история).
+    """
+    cpu_pairs: List[List[str]] = get_core_temperatures(hwmon_dir)
+    if on_read is not None:
+        on_read(cpu_pairs)
 
     # Если нет данных, просто выводим как есть
     if not cpu_pairs or cpu_pairs == [["Температура CPU", "N/A"]]:
@@ -69,9 +81,12 @@ def get_temperature(temp_path: str) -> float:
 
 
 @error_decorate((FileNotFoundError, PermissionError, ValueError, OSError))
-def get_core_temperatures() -> List[List[str]]:
-    """Нахождение температуры для каждого ядра."""
-    hwmon_dir = '/sys/class/hwmon'
+def get_core_temperatures(hwmon_dir: str = HWMON_DIR) -> List[List[str]]:
+    """
+    Нахождение температуры для каждого ядра.
+
+    :param hwmon_dir: Каталог hwmon.
+    """
     cpu_keywords = ('core', 'cpu', 'package', 'tdie', 'tctl')
     temps: List[List[str]] = []
 
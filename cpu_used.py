@@ -1,5 +1,5 @@
 import time
-from typing import List
+from typing import Callable, List
 
 from util import error_decorate
 from table import format_table, create_separator
@@ -99,11 +99,15 @@ def get_general_statistic(
 
 
 @error_decorate((FileNotFoundError, PermissionError, ValueError, OSError))
-def get_cpu_usage(interval=1) -> List[str]:
+def get_cpu_usage(
+    interval=1,
+    on_read: Callable[[List[List[int]]], None] | None = None
+) -> List[str]:
     """
     Запрашивает данные для замера использования CPU и
     отправляет на группировку и обработку.
     :param interval: По умолчанию 1 секунда.
+    :param on_read: Получатель разниц счётчиков (например, история).
     """
     cpu_lines1 = read_cpu_stats()
     stats1 = parse_cpu_stats(cpu_lines1)
@@ -118,5 +122,8 @@ def get_cpu_usage(interval=1) -> List[str]:
         diff = [stats2[i][j] - stats1[i][j] for j in range(len(stats1[i]))]
         diffs.append(diff)
 
+    if on_read is not None:
+        on_read(diffs)
+
     freqs: list[float] = get_cpu_frequencies()
     return get_general_statistic(diffs, freqs)
@@ -0,0 +1,357 @@
+import os
+import time
+import sqlite3
+import threading
+from typing import Dict, List, Tuple
+
+from cpu_used import aggreagate_data_core
+
+# Сколько хранится каждый уровень истории (секунды)
+RAW_RETENTION = 3600
+MINUTE_RETENTION = 7 * 86400
+HOUR_RETENTION = 365 * 86400
+# Как часто накопленные замеры записываются на диск (секунды)
+FLUSH_INTERVAL = 30
+# Предел буфера, если запись на диск долго не удаётся
+MAX_BUFFER = 10000
+
+# Метрика: (название, единица, верхняя граница шкалы)
+METRICS = {
+    'cpu': ("ЗАГРУЗКА CPU", "%", 100),
+    'temp': ("ТЕМПЕРАТУРА CPU", "°C", 100),
+}
+
+# Масштабы графика: (длительность в секундах, подпись)
+ZOOM_SPANS = [
+    (600, "10 мин"),
+    (3600, "1 ч"),
+    (6 * 3600, "6 ч"),
+    (86400, "1 дн"),
+    (7 * 86400, "7 дн"),
+    (30 * 86400, "30 дн"),
+    (365 * 86400, "1 год"),
+]
+
+
+def get_history_path() -> str:
+    """Путь к файлу истории в каталоге данных пользователя."""
+    data_dir = os.environ.get(
+        'XDG_DATA_HOME', os.path.expanduser('~/.local/share')
+    )
+    return os.path.join(data_dir, 'system-monitor', 'history.db')
+
+
+def select_tier(start: int, now: int) -> int:
+    """
+    Уровень истории, который ещё хранит данные с момента start:
+    0 - замеры, 1 - минутные, 2 - часовые значения.
+
+    :param start: Начало периода.
+    :param now: Текущее время.
+    """
+    age = now - start
+    if age <= RAW_RETENTION:
+        return 0
+    if age <= MINUTE_RETENTION:
+        return 1
+    return 2
+
+
+class HistoryStore:
+    """
+    Хранилище истории замеров в SQLite.
+
+    Ежесекундные замеры (уровень 0) хранятся RAW_RETENTION секунд и
+    сворачиваются в минутные (уровень 1) и часовые (уровень 2) значения
+    min/avg/max. Каждый уровень хранится ограниченное время, поэтому
+    размер файла не растёт. Замеры копятся в памяти и записываются
+    одной транзакцией раз в FLUSH_INTERVAL секунд.
+
+    История необязательна: если базу не удалось открыть, хранилище
+    отключается, а ошибки записи и чтения пропускаются.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        :param path: Путь к файлу базы.
+        """
+        self.lock = threading.Lock()
+        self.write_lock = threading.Lock()
+        self.buffer: List[Tuple[str, int, float]] = []
+        self.last_flush: float = time.monotonic()
+        self.enabled = True
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            self.conn = sqlite3.connect(path, check_same_thread=False)
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.execute("PRAGMA journal_size_limit=1048576")
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS samples ("
+                "tier INTEGER, metric TEXT, ts INTEGER, "
+                "min REAL, avg REAL, max REAL, n INTEGER, "
+                "PRIMARY KEY (tier, metric, ts)) WITHOUT ROWID"
+            )
+            self.conn.commit()
+            # Отдельное соединение для графика: в режиме WAL чтение
+            # не ждёт записи.
+            self.reader = sqlite3.connect(path, check_same_thread=False)
+        except (sqlite3.Error, OSError):
+            self.enabled = False
+
+    def add(self, metric: str, value: float, ts: int | None = None) -> None:
+        """
+        Добавление замера в буфер.
+
+        :param metric: Название метрики.
+        :param value: Значение.
+        :param ts: Время замера (по умолчанию текущее).
+        """
+        if not self.enabled:
+            return
+        if ts is None:
+            ts = int(time.time())
+        with self.lock:
+            self.buffer.append((metric, ts, value))
+
+    def _rollup(self, tier: int, source: int, step: int, start: int) -> None:
+        """
+        Пересчёт свёрнутых значений начиная с заданного времени.
+
+        :param tier: Уровень, в который записываем.
+        :param source: Уровень, из которого сворачиваем.
+        :param step: Длина интервала в секундах.
+        :param start: Время, с которого пересчитываем.
+        """
+        self.conn.execute(
+            "INSERT OR REPLACE INTO samples "
+            "SELECT ?, metric, ts / ? * ?, MIN(min), "
+            "SUM(avg * n) / SUM(n), MAX(max), SUM(n) "
+            "FROM samples WHERE tier = ? AND ts >= ? "
+            "GROUP BY metric, ts / ?",
+            (tier, step, step, source, start // step * step, step)
+        )
+
+    def flush(self) -> None:
+        """
+        Запись буфера, пересчёт свёрток и удаление старых данных.
+        При ошибке базы замеры возвращаются в буфер до следующей попытки.
+        """
+        if not self.enabled:
+            return
+        with self.write_lock:
+            with self.lock:
+                self.last_flush = time.monotonic()
+                batch, self.buffer = self.buffer, []
+            if not batch:
+                return
+            start: int = min(ts for _, ts, _ in batch)
+            now = int(time.time())
+            try:
+                with self.conn:
+                    self.conn.executemany(
+                        "INSERT OR REPLACE INTO samples "
+                        "VALUES (0, ?, ?, ?, ?, ?, 1)",
+                        [(m, ts, v, v, v) for m, ts, v in batch]
+                    )
+                    self._rollup(1, 0, 60, start)
+                    self._rollup(2, 1, 3600, start)
+                    for tier, retention in enumerate(
+                        (RAW_RETENTION, MINUTE_RETENTION, HOUR_RETENTION)
+                    ):
+                        self.conn.execute(
+                            "DELETE FROM samples WHERE tier = ? AND ts < ?",
+                            (tier, now - retention)
+                        )
+            except sqlite3.Error:
+                with self.lock:
+                    self.buffer = (batch + self.buffer)[-MAX_BUFFER:]
+
+    def flush_if_due(self) -> None:
+        """Запись буфера, если прошло FLUSH_INTERVAL секунд."""
+        if time.monotonic() - self.last_flush >= FLUSH_INTERVAL:
+            self.flush()
+
+    def query(
+        self, metric: str, start: int, end: int, points: int
+    ) -> List[Tuple[float, float, float] | None]:
+        """
+        Значения min/avg/max за период, разбитые на points интервалов.
+        Для длинных периодов читаются свёрнутые уровни вместо замеров.
+        Ещё не записанные замеры из буфера тоже учитываются.
+
+        :param metric: Название метрики.
+        :param start: Начало периода.
+        :param end: Конец периода.
+        :param points: Количество интервалов.
+        """
+        result: List[Tuple[float, float, float] | None] = [None] * points
+        if not self.enabled:
+            return result
+        tier = select_tier(start, int(time.time()))
+        span = max(end - start, 1)
+
+        try:
+            rows = self.reader.execute(
+                "SELECT (ts - ?) * ? / ? AS bucket, MIN(min), "
+                "SUM(avg * n), SUM(n), MAX(max) "
+                "FROM samples WHERE tier = ? AND metric = ? "
+                "AND ts >= ? AND ts < ? GROUP BY bucket",
+                (start, points, span, tier, metric, start, end)
+            ).fetchall()
+        except sqlite3.Error:
+            rows = []
+        with self.lock:
+            rows += [
+                ((ts - start) * points // span, value, value, 1, value)
+                for name, ts, value in self.buffer
+                if name == metric and start <= ts < end
+            ]
+
+        # Интервал: [min, сумма, количество, max]
+        buckets: Dict[int, List[float]] = {}
+        for bucket, low, total, count, high in rows:
+            if not 0 <= bucket < points:
+                continue
+            if bucket not in buckets:
+                buckets[bucket] = [low, total, count, high]
+                continue
+            acc = buckets[bucket]
+            acc[0] = min(acc[0], low)
+            acc[1] += total
+            acc[2] += count
+            acc[3] = max(acc[3], high)
+        for bucket, (low, total, count, high) in buckets.items():
+            result[bucket] = (low, total / count, high)
+        return result
+
+    def close(self) -> None:
+        """Запись остатка буфера и закрытие базы."""
+        if not self.enabled:
+            return
+        self.flush()
+        self.conn.close()
+        self.reader.close()
+
+
+class HistoryRecorder:
+    """
+    Запись в историю данных, которые уже прочитали другие сборщики.
+    Сам рекордер датчики не читает.
+    """
+
+    def __init__(self, store: HistoryStore) -> None:
+        """
+        :param store: Хранилище истории.
+        """
+        self.store = store
+
+    def record_cpu(self, diffs: List[List[int]]) -> None:
+        """
+        Запись общей загрузки CPU.
+
+        :param diffs: Разницы счётчиков /proc/stat, первая строка - общая.
+        """
+        if diffs and len(diffs[0]) >= 8:
+            self.store.add('cpu', aggreagate_data_core(diffs[0]))
+
+    def record_temperatures(self, cpu_pairs: List[List[str]]) -> None:
+        """
+        Запись максимальной температуры среди ядер.
+
+        :param cpu_pairs: Пары (метка, температура) из get_core_temperatures.
+        """
+        temps: List[float] = []
+        for _, value in cpu_pairs:
+            try:
+                temps.append(float(value.rstrip("°C")))
+            except ValueError:
+                continue
+        if temps:
+            self.store.add('temp', max(temps))
+
+    def write(self) -> list:
+        """
+        Запись накопленных замеров на диск. Возвращает пустой список,
+        так как отдельного раздела на дисплее нет.
+        """
+        self.store.flush_if_due()
+        return []
+
+
+class HistoryView:
+    """График истории с изменяемым масштабом для curses."""
+
+    def __init__(self, store: HistoryStore) -> None:
+        """
+        :param store: Хранилище истории.
+        """
+        self.store = store
+        self.active = False
+        self.zoom = 1
+
+    def zoom_in(self) -> None:
+        """Уменьшение отображаемого периода."""
+        self.zoom = max(self.zoom - 1, 0)
+
+    def zoom_out(self) -> None:
+        """Увеличение отображаемого периода."""
+        self.zoom = min(self.zoom + 1, len(ZOOM_SPANS) - 1)
+
+    @staticmethod
+    def render_chart(
+        title: str,
+        unit: str,
+        limit: float,
+        values: List[Tuple[float, float, float] | None],
+        rows: int
+    ) -> List[str]:
+        """
+        Столбчатый график по средним значениям.
+
+        :param title: Заголовок.
+        :param unit: Единица измерения.
+        :param limit: Верхняя граница шкалы.
+        :param values: Значения min/avg/max по интервалам.
+        :param rows: Высота графика в строках.
+        """
+        known = [v for v in values if v is not None]
+        if known:
+            low = min(v[0] for v in known)
+            avg = sum(v[1] for v in known) / len(known)
+            high = max(v[2] for v in known)
+            title = (f"{title}  мин {low:.1f}{unit} | "
+                     f"сред {avg:.1f}{unit} | макс {high:.1f}{unit}")
+        lines = [title]
+        for row in range(rows, 0, -1):
+            level = limit * row / rows
+            line = f"{level:5.0f} │"
+            for value in values:
+                if value is not None and value[1] >= level - limit / rows / 2:
+                    line += "█"
+                else:
+                    line += " "
+            lines.append(line)
+        lines.append("      └" + "─" * len(values))
+        return lines
+
+    def render(self, width: int, height: int) -> List[str]:
+        """
+        Отображение графиков всех метрик.
+
+        :param width: Ширина окна.
+        :param height: Доступная высота.
+        """
+        if not self.store.enabled:
+            return ["История недоступна: не удалось открыть базу", ""]
+        span, label = ZOOM_SPANS[self.zoom]
+        end = int(time.time())
+        points = max(width - 8, 1)
+        rows = max((height - 2) // len(METRICS) - 3, 1)
+
+        lines = [f"ИСТОРИЯ ЗА {label} | +/- масштаб | H-назад", ""]
+        for metric, (title, unit, limit) in METRICS.items():
+            values = self.store.query(metric, end - span, end, points)
+            lines.extend(self.render_chart(title, unit, limit, values, rows))
+            lines.append("")
+        return lines
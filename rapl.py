@@ -0,0 +1,129 @@
+import os
+import time
+from typing import List, Tuple
+
+from table import format_table
+
+POWERCAP_DIR = '/sys/class/powercap'
+
+# Домены RAPL, которые выводятся на дисплей
+DOMAIN_TITLES = {
+    'package': 'CPU',
+    'core': 'ядра',
+    'dram': 'ОЗУ',
+}
+
+
+class RaplDomain:
+    """
+    Домен RAPL с постоянно открытым счётчиком энергии.
+
+    Файл energy_uj не переоткрывается на каждом такте, поэтому
+    чтение дешёвое и его можно выполнять часто.
+    """
+
+    def __init__(self, path: str, title: str, socket: str) -> None:
+        """
+        :param path: Путь к домену в /sys/class/powercap.
+        :param title: Название домена для отображения.
+        :param socket: Номер процессорного сокета.
+        """
+        self.title = title
+        self.socket = socket
+        with open(os.path.join(path, 'max_energy_range_uj')) as file:
+            self.max_energy: int = int(file.read())
+        self.handle = open(os.path.join(path, 'energy_uj'))
+        self.last_energy: int | None = None
+        self.last_time: float = 0.0
+
+    def read_energy(self) -> int:
+        """Чтение счётчика энергии в микроджоулях."""
+        self.handle.seek(0)
+        return int(self.handle.read())
+
+    def get_watts(self) -> float | None:
+        """
+        Мощность по разнице счётчика с предыдущего замера.
+        При первом замере возвращает None.
+        """
+        energy: int = self.read_energy()
+        now: float = time.monotonic()
+        watts = None
+        if self.last_energy is not None and now > self.last_time:
+            delta: int = energy - self.last_energy
+            # Счётчик переполнился и начал отсчёт с нуля
+            if delta < 0:
+                delta += self.max_energy
+            watts = delta / (now - self.last_time) / 1000000
+        self.last_energy = energy
+        self.last_time = now
+        return watts
+
+
+def find_rapl_domains(powercap_dir: str = POWERCAP_DIR) -> List[RaplDomain]:
+    """
+    Поиск доменов RAPL (package, core, dram).
+    Домены без прав на чтение пропускаются.
+
+    :param powercap_dir: Каталог powercap.
+    """
+    domains: List[RaplDomain] = []
+    if not os.path.isdir(powercap_dir):
+        return domains
+
+    for entry in sorted(os.listdir(powercap_dir)):
+        if not entry.startswith('intel-rapl:'):
+            continue
+        path = os.path.join(powercap_dir, entry)
+        try:
+            with open(os.path.join(path, 'name')) as file:
+                name: str = file.read().strip()
+            kind: str = name.split('-')[0]
+            if kind not in DOMAIN_TITLES:
+                continue
+            socket: str = entry.split(':')[1]
+            domains.append(RaplDomain(path, DOMAIN_TITLES[kind], socket))
+        except (FileNotFoundError, PermissionError, ValueError, OSError):
+            continue
+    return domains
+
+
+_domains: List[RaplDomain] | None = None
+
+
+def get_rapl_power() -> List[Tuple[str, float]]:
+    """
+    Мощность по доменам RAPL в виде пар (название, ватты).
+    Домены ищутся один раз при первом вызове.
+    """
+    global _domains
+    if _domains is None:
+        _domains = find_rapl_domains()
+
+    multi_socket: bool = len({d.socket for d in _domains}) > 1
+    power: List[Tuple[str, float]] = []
+    for domain in _domains:
+        try:
+            watts = domain.get_watts()
+        except (ValueError, OSError):
+            continue
+        if watts is None:
+            continue
+        title = domain.title
+        if multi_socket:
+            title = f"{title} {domain.socket}"
+        power.append((f"Мощность({title})", round(watts, 2)))
+    return power
+
+
+def get_power_info() -> List[str]:
+    """
+    Мощность по доменам RAPL в виде горизонтальной таблицы.
+    Если доменов нет или ещё нет предыдущего замера, раздел не выводится.
+    """
+    power: List[Tuple[str, float]] = get_rapl_power()
+    if not power:
+        return []
+    keys = [name for name, _ in power]
+    values = [f"{watts} Ватт" for _, watts in power]
+    return format_table("МОЩНОСТЬ RAPL", [keys, values])
@@ -4,16 +4,21 @@ import curses
 import asyncio
 import sys
 from asyncio import AbstractEventLoop
-from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from asyncio.exceptions import CancelledError
 
 import ssd_info
+from collector import Collector, DaemonExecutor
+from history import (
+    HistoryStore, HistoryRecorder, HistoryView, get_history_path
+)
 from util import error_decorate
 from cpu_used import get_cpu_usage
 from disk import get_disk_info
 from core import get_cpu_info
 from memory import get_memory_info
 from voltage import get_fan_and_in
+from rapl import get_power_info
 
 
 def safe_addstr(
@@ -33,7 +38,11 @@ def safe_addstr(
         pass
 
 
-def time_sleep(seconds=1):
+# Длительность одного кадра (секунды)
+FRAME_TIME = 1
+
+
+def time_sleep(seconds=FRAME_TIME):
     """
     Функция для синхронизации времени обновления данных.
     Все остальные функции уже должны будут собрать необходимые
@@ -44,17 +53,22 @@ def time_sleep(seconds=1):
 
 
 @error_decorate((KeyboardInterrupt, CancelledError))
-def display_app(lst_info: list, stdscr, start_time) -> None:
+def display_app(
+    lst_info: list, stdscr, start_time, view: HistoryView
+) -> None:
     """
     Отображение собранных данных для мониторинга.
 
     :param lst_info: Двумерный список с собранными данными.
     :param stdsrc: Отображение на дисплее данных.
     :param start time: Начальное время старта.
+    :param view: График истории.
     """
     stdscr.nodelay(1)  # type: ignore
     stdscr.clear()
     height, width = stdscr.getmaxyx()
+    if view.active:
+        lst_info = [view.render(width - 1, height - 1)]
     y = 0  # Высота
     for section in lst_info:
         for line in section:
@@ -66,7 +80,8 @@ def display_app(lst_info: list, stdscr, start_time) -> None:
 
     elapsed = time.time() - start_time
     time_str = (f"Обновлено: {time.strftime('%H:%M:%S')} "
-                f"| Q-выход | Задержка: {elapsed:.1f}с | D-ssd info |")
+                f"| Q-выход | Задержка: {elapsed:.1f}с | D-ssd info "
+                f"| H-история |")
     safe_addstr(stdscr, height - 1, 0, time_str[:width - 1])
     stdscr.refresh()
 
@@ -75,6 +90,15 @@ def display_app(lst_info: list, stdscr, start_time) -> None:
     if ch in (ord('q'), ord('Q')):
         sys.exit(0)
 
+    elif ch in (ord('h'), ord('H')):
+        view.active = not view.active
+
+    elif view.active and ch in (ord('+'), ord('=')):
+        view.zoom_in()
+
+    elif view.active and ch in (ord('-'), ord('_')):
+        view.zoom_out()
+
     elif ch in (ord('d'), ord('D')):
         stdscr.clear()
         curses.endwin()
@@ -95,21 +119,43 @@ async def run_main(stdscr: curses.window) -> None:
                                     используемое для вывода
     """
     curses.curs_set(0)
-    while True:
-        start_time: float = time.time()
-        # Получаем динамические данные асинхронно
-        with ThreadPoolExecutor(max_workers=6) as pool:
-            loop: AbstractEventLoop = asyncio.get_running_loop()
-            tasks: list = [
-                loop.run_in_executor(pool, get_disk_info),
-                loop.run_in_executor(pool, get_cpu_usage),
-                loop.run_in_executor(pool, get_memory_info),
-                loop.run_in_executor(pool, get_cpu_info),
-                loop.run_in_executor(pool, get_fan_and_in),
-                loop.run_in_executor(pool, time_sleep)
+    store = HistoryStore(get_history_path())
+    view = HistoryView(store)
+    recorder = HistoryRecorder(store)
+    # Кадр и так длится не меньше FRAME_TIME, поэтому пропуском
+    # считается только чтение, которое растягивает кадр.
+    collectors: list[Collector] = [
+        Collector(get_disk_info, deadline=FRAME_TIME),
+        Collector(
+            partial(get_cpu_usage, on_read=recorder.record_cpu),
+            deadline=FRAME_TIME + 0.5
+        ),
+        Collector(get_memory_info, deadline=FRAME_TIME),
+        Collector(
+            partial(get_cpu_info, on_read=recorder.record_temperatures),
+            deadline=FRAME_TIME
+        ),
+        Collector(get_fan_and_in, deadline=FRAME_TIME),
+        Collector(get_power_info, deadline=FRAME_TIME),
+        Collector(time_sleep, deadline=FRAME_TIME + 0.5),
+        Collector(recorder.write, deadline=FRAME_TIME)
+    ]
+    pool = DaemonExecutor()
+    try:
+        loop: AbstractEventLoop = asyncio.get_running_loop()
+        while True:
+            start_time: float = time.time()
+            tick_start: float = time.monotonic()
+            # Получаем динамические данные асинхронно
+            for collector in collectors:
+                collector.submit(loop, pool)
+            results = [
+                await collector.collect(tick_start)
+                for collector in collectors
             ]
-            results = await asyncio.gather(*tasks)
-            display_app(results, stdscr, start_time)
+            display_app(results, stdscr, start_time, view)
+    finally:
+        store.close()
 
 
 @error_decorate((KeyboardInterrupt,))
@@ -0,0 +1,95 @@
+import os
+import time
+import asyncio
+import threading
+from functools import partial
+
+import pytest
+
+import collector
+from collector import Collector, DaemonExecutor, SLOW_LANE_MISSES
+from core import get_core_temperatures
+
+DEADLINE = 0.1
+
+
+@pytest.fixture
+def sleeping_sensor(tmp_path):
+    """
+    Каталог hwmon с датчиком, который отвечает с задержкой.
+    temp1_input — именованный канал: каждое чтение ждёт delay секунд
+    и возвращает следующее значение (1.0°C, 2.0°C, ...).
+    """
+    device = tmp_path / 'hwmon0'
+    device.mkdir()
+    (device / 'temp1_label').write_text("Core 0\n")
+    fifo = device / 'temp1_input'
+    os.mkfifo(fifo)
+    state = {'delay': 0.0, 'reads': 0}
+
+    def writer() -> None:
+        while True:
+            fd = os.open(fifo, os.O_WRONLY)
+            time.sleep(state['delay'])
+            state['reads'] += 1
+            os.write(fd, f"{state['reads'] * 1000}\n".encode())
+            os.close(fd)
+            # Даём читателю закрыть канал до следующего ответа
+            time.sleep(0.02)
+
+    threading.Thread(target=writer, daemon=True).start()
+    return str(tmp_path), state
+
+
+async def run_ticks(
+    sensor: Collector, pool: DaemonExecutor, stop, limit: int = 30
+) -> list:
+    """Такты до выполнения условия stop, возвращает результаты."""
+    loop = asyncio.get_running_loop()
+    results = []
+    for _ in range(limit):
+        tick_start = time.monotonic()
+        sensor.submit(loop, pool)
+        results.append(await sensor.collect(tick_start))
+        if stop():
+            break
+        await asyncio.sleep(0.05)
+    return results
+
+
+async def check_quarantine(hwmon_dir: str, state: dict) -> None:
+    """Сценарий: свежее значение, перенос, карантин и возврат."""
+    pool = DaemonExecutor()
+    sensor = Collector(
+        partial(get_core_temperatures, hwmon_dir), deadline=DEADLINE
+    )
+
+    # Быстрый датчик отдаёт свежее значение в том же такте
+    results = await run_ticks(sensor, pool, lambda: True)
+    assert results == [[["Core 0", "1.0°C"]]]
+
+    # Медленный датчик: показываем прошлое значение, затем карантин
+    state['delay'] = 0.3
+    results = await run_ticks(sensor, pool, lambda: sensor.slow)
+    assert results[0] == [["Core 0", "1.0°C"]]
+    assert sensor.slow
+    assert sensor.misses == SLOW_LANE_MISSES
+
+    # В медленной полосе кадр не ждёт датчик
+    tick_start = time.monotonic()
+    await run_ticks(sensor, pool, lambda: True)
+    assert time.monotonic() - tick_start < DEADLINE
+
+    # Датчик снова отвечает быстро и возвращается в обычную полосу
+    state['delay'] = 0.0
+    results = await run_ticks(sensor, pool, lambda: not sensor.slow)
+    assert not sensor.slow
+    assert sensor.misses == 0
+    assert results[-1] != [["Core 0", "1.0°C"]]
+
+
+def test_slow_sensor_is_quarantined_and_restored(
+    sleeping_sensor, monkeypatch
+):
+    monkeypatch.setattr(collector, 'SLOW_LANE_INTERVAL', 0.3)
+    asyncio.run(check_quarantine(*sleeping_sensor))
@@ -0,0 +1,100 @@
+import time
+
+import pytest
+
+from history import (
+    HistoryStore, HistoryRecorder, select_tier, ZOOM_SPANS,
+    MINUTE_RETENTION
+)
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Хранилище истории во временном каталоге."""
+    store = HistoryStore(str(tmp_path / 'history.db'))
+    yield store
+    store.close()
+
+
+def rows(store: HistoryStore, tier: int) -> list:
+    """Строки уровня истории в виде (ts, min, avg, max, n)."""
+    return store.conn.execute(
+        "SELECT ts, min, avg, max, n FROM samples "
+        "WHERE tier = ? ORDER BY ts", (tier,)
+    ).fetchall()
+
+
+def test_rollup_weights_average_by_count(store):
+    # Час, закончившийся два часа назад: замеры уже удаляются
+    hour = (int(time.time()) // 3600 - 2) * 3600
+    store.add('cpu', 10, ts=hour)
+    store.add('cpu', 20, ts=hour + 1)
+    store.add('cpu', 60, ts=hour + 60)
+    store.flush()
+
+    assert rows(store, 0) == []
+    assert rows(store, 1) == [
+        (hour, 10, 15, 20, 2),
+        (hour + 60, 60, 60, 60, 1),
+    ]
+    # Среднее за час взвешено по количеству замеров: (10+20+60)/3
+    assert rows(store, 2) == [(hour, 10, 30, 60, 3)]
+
+
+def test_minute_tier_is_pruned_before_hour_tier(store):
+    old = (int(time.time()) - MINUTE_RETENTION - 7200) // 3600 * 3600
+    store.add('temp', 50, ts=old)
+    store.flush()
+
+    assert rows(store, 1) == []
+    assert rows(store, 2) == [(old, 50, 50, 50, 1)]
+
+
+@pytest.mark.parametrize("span, tier", list(zip(
+    [span for span, _ in ZOOM_SPANS], [0, 0, 1, 1, 1, 2, 2]
+)))
+def test_select_tier_for_zoom_spans(span, tier):
+    now = int(time.time())
+    assert select_tier(now - span, now) == tier
+
+
+def test_query_reads_rollups_and_unflushed_buffer(store):
+    now = int(time.time())
+    store.add('cpu', 40, ts=now - 36 * 3600)
+    store.flush()
+    store.add('cpu', 80, ts=now - 1)
+
+    values = store.query('cpu', now - 7 * 86400, now, 7)
+    assert values[5] == (40, 40, 40)
+    assert values[6] == (80, 80, 80)
+    assert values[:5] == [None] * 5
+
+
+def test_unwritable_path_disables_history(tmp_path):
+    blocker = tmp_path / 'file'
+    blocker.write_text("")
+    store = HistoryStore(str(blocker / 'history.db'))
+
+    assert not store.enabled
+    store.add('cpu', 10)
+    store.flush()
+    assert store.query('cpu', 0, 10, 2) == [None, None]
+    store.close()
+
+
+def test_flush_error_keeps_samples(store):
+    store.conn.close()
+    store.add('cpu', 10, ts=100)
+    store.flush()
+    assert store.buffer == [('cpu', 100, 10)]
+
+
+def test_recorder_uses_collected_values(store):
+    recorder = HistoryRecorder(store)
+    recorder.record_temperatures([["Core 0", "40.0°C"], ["Core 1", "55.5°C"]])
+    recorder.record_temperatures([["Температура CPU", "N/A"]])
+    recorder.record_cpu([[10, 0, 10, 80, 0, 0, 0, 0]])
+
+    assert [(m, v) for m, _, v in store.buffer] == [
+        ('temp', 55.5), ('cpu', 20.0)
+    ]
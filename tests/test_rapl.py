@@ -0,0 +1,34 @@
+import rapl
+from rapl import find_rapl_domains
+
+
+def make_domain(root, entry: str, name: str, energy: int) -> None:
+    """Создание домена RAPL в поддельном каталоге powercap."""
+    domain = root / entry
+    domain.mkdir()
+    (domain / 'name').write_text(f"{name}\n")
+    (domain / 'max_energy_range_uj').write_text("1000000\n")
+    (domain / 'energy_uj').write_text(f"{energy}\n")
+
+
+def test_find_rapl_domains_skips_other_domains(tmp_path):
+    make_domain(tmp_path, 'intel-rapl:0', 'package-0', 0)
+    make_domain(tmp_path, 'intel-rapl:0:0', 'core', 0)
+    make_domain(tmp_path, 'intel-rapl:0:1', 'uncore', 0)
+    make_domain(tmp_path, 'intel-rapl:0:2', 'dram', 0)
+
+    domains = find_rapl_domains(str(tmp_path))
+    assert [d.title for d in domains] == ['CPU', 'ядра', 'ОЗУ']
+
+
+def test_get_watts_handles_wraparound(tmp_path, monkeypatch):
+    make_domain(tmp_path, 'intel-rapl:0', 'package-0', 990000)
+    domain = find_rapl_domains(str(tmp_path))[0]
+
+    monkeypatch.setattr(rapl.time, 'monotonic', lambda: 10.0)
+    assert domain.get_watts() is None
+
+    # Счётчик переполнился: 990000 -> 1000000 -> 0 -> 10000
+    (tmp_path / 'intel-rapl:0' / 'energy_uj').write_text("10000\n")
+    monkeypatch.setattr(rapl.time, 'monotonic', lambda: 10.5)
+    assert domain.get_watts() == 0.04
@@ -3,7 +3,7 @@ from typing import List
 
 
 from util import error_decorate
-from core import get_hwmon_devices
+from core import get_hwmon_devices, HWMON_DIR
 from table import format_table
 
 
@@ -66,7 +66,7 @@ def get_mark_fan(val: float) -> str:
         return "Максимальная нагрузка"
 
 
-def get_mark_power(val: int) -> str:
+def get_mark_power(val: float) -> str:
     """
     Получаем информацию о мощности.
     :param val: Значение мощности.
@@ -78,7 +78,7 @@ def get_mark_power(val: int) -> str:
     elif 35 >= val > 25:
         return "Высокая(1-1,5ч)"
     else:
-        "Максимальная(<1ч)"
+        return "Максимальная(<1ч)"
 
 
 def find_path_for_writing(device_path, files: list[str], lst: list[list]):
@@ -121,9 +121,12 @@ def find_path_for_writing(device_path, files: list[str], lst: list[list]):
 
 
 @error_decorate((FileNotFoundError, PermissionError, ValueError, OSError))
-def get_fan_and_in() -> List[List[str]]:
-    """Нахождение температуры для каждого ядра."""
-    hwmon_dir = '/sys/class/hwmon'
+def get_fan_and_in(hwmon_dir: str = HWMON_DIR) -> List[List[str]]:
+    """
+    Нахождение температуры для каждого ядра.
+
+    :param hwmon_dir: Каталог hwmon.
+    """
     data = [[], [], []]
 
     hwmon_devices = get_hwmon_devices(hwmon_dir)